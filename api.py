@@ -59,21 +59,19 @@ results[:3]
 # 데이터프레임 변환 및 저장
 
 from datetime import datetime
-import re
+# HTML 태그 제거 및 엔티티(&quot; 등) 변환 - 대시보드와 같은 정제 규칙
+from text_clean import strip_markup
 
 # 저장할 빈 데이터프레임 생성
 df = pd.DataFrame()
 
-# 문자열에서 제거할 tag를 지정
-remove_tags = re.compile(r'<.*?>')
-
 # 검색 결과에서 필요한 정보 추출
 for item in results:
     new_data = pd.DataFrame(
         data={
             'pubDate': datetime.strptime(item['pubDate'], '%a, %d %b %Y %H:%M:%S +0900'),
-            'title': re.sub(remove_tags, '', item['title']),
-            'description': re.sub(remove_tags, '', item['description'])
+            'title': strip_markup(item['title']),
+            'description': strip_markup(item['description'])
         },
         index=[0]
     )
@@ -3,11 +3,16 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 from datetime import datetime
-import re
 from collections import Counter
 from itertools import combinations
 import os
 
+# 텍스트 정제 (수집 단계와 공통 규칙)
+from text_clean import clean_series
+
+# 이미지 에셋 (리사이즈/압축 이미지)
+import assets
+
 # 시각화 라이브러리
 import matplotlib.pyplot as plt
 import seaborn as sns
@@ -51,27 +56,94 @@ stop_str = '예정 에 가 이은 을 를 의 도 또한 더 를 위해 에게 
 # 불용어 문자열을 ' '로 분리한 후 set으로 변환
 stop_words = set(stop_str.split(' '))
 
-# 텍스트 정제 함수
-def cleanString(text):
-    """텍스트 정제 함수"""
-    # HTML 태그 제거 (강의록 13.ipynb)
-    pattern = r'(<[^>]*>)'
-    text = re.sub(pattern=pattern, repl='', string=text)
-    
-    # 특수문자 제거
-    pattern = r'[^\w\s\n]'
-    text = re.sub(pattern=pattern, repl='', string=text)
-    
-    return text
+# 데이터프레임 경량화 함수
+def compact_frame(df):
+    """데이터프레임 경량화 함수
+
+    - title, description: Arrow 기반 문자열
+    - date: 전체 기간 날짜를 범주로 하는 순서형 범주 (정수 일자 인덱스)
+    - week_label, month: 날짜 단위로 한 번만 계산한 순서형 범주
+    - title_clean, description_clean: 정제된 텍스트 (데이터와 함께 캐싱)
+    """
+    df = df[['pubDate', 'title', 'description', 'date']].copy()
+    df['pubDate'] = pd.to_datetime(df['pubDate'])
+    df['title'] = df['title'].astype('string[pyarrow]')
+    df['description'] = df['description'].astype('string[pyarrow]')
+    df['title_clean'] = clean_series(df['title'])
+    df['description_clean'] = clean_series(df['description'])
+
+    # 날짜 -> 정수 일자 인덱스 (분석 시작일 기준)
+    dates = pd.to_datetime(df['date']).dt.normalize()
+    days = pd.date_range(dates.min(), dates.max(), freq='D')
+    df['date'] = pd.Categorical(dates, categories=days, ordered=True)
+    day_idx = df['date'].cat.codes
+
+    # 주차/월 라벨은 날짜별로 계산한 뒤 일자 인덱스로 펼침
+    day_weeks = days.strftime('%m월 ') + ((days.day - 1) // 7 + 1).astype(str) + '주차'
+    week_labels = pd.unique(day_weeks)
+    df['week_label'] = pd.Categorical.from_codes(
+        pd.Index(week_labels).get_indexer(day_weeks)[day_idx],
+        categories=week_labels,
+        ordered=True
+    )
+    months = np.unique(days.month)
+    df['month'] = pd.Categorical.from_codes(
+        np.searchsorted(months, days.month)[day_idx],
+        categories=months,
+        ordered=True
+    )
+    return df
 
 # 캐싱 함수 정의
-@st.cache_data
+# cache_resource: 모든 세션이 하나의 데이터프레임을 공유 (세션별 복사본 없음)
+# 공유 객체이므로 분석 섹션에서는 df에 컬럼을 추가하거나 수정하지 않음
+@st.cache_resource
 def load_data():
     """데이터 로드 함수"""
     df = pd.read_csv('data/naver_news.csv')
-    df['pubDate'] = pd.to_datetime(df['pubDate'])
-    df['date'] = pd.to_datetime(df['date'])
-    return df
+    return compact_frame(df)
+
+@st.cache_resource
+def load_sample_data():
+    """테스트용 샘플 데이터 생성 함수"""
+    np.random.seed(42)
+    dates = pd.date_range(start='2025-06-15', end='2025-09-20', freq='D')
+    
+    # 샘플 데이터
+    sample_data = []
+    keywords = ['노래', '케이팝', '한국', '넷플릭스', '인기', '응원', '최고', '문화', '주말', '아이돌', '케데헌', '케데헌 효과']
+    
+    for date in dates:
+        n_articles = np.random.randint(50, 300)
+        for _ in range(n_articles // 10):
+            title = f"케이팝 데몬 헌터스 {np.random.choice(keywords)} 화제"
+            desc = f"{np.random.choice(keywords)} {np.random.choice(keywords)} 케이팝 데몬 헌터스 {np.random.choice(keywords)}"
+            sample_data.append({
+                'pubDate': date,
+                'title': title,
+                'description': desc,
+                'date': date
+            })
+    
+    return compact_frame(pd.DataFrame(sample_data))
+
+# 이미지 캐싱 함수
+# 변환된 이미지 바이트를 메모리에 보관 (rerun마다 파일 확인/전송 크기 감소)
+# JPEG/PNG로 인코딩되어 있어 st.image가 다시 인코딩하지 않고 그대로 전송
+@st.cache_resource
+def load_image(path, width):
+    """리사이즈된 이미지 로드 함수 (원본이 없으면 None)"""
+    return assets.load_variant(path, width)
+
+@st.cache_resource
+def load_poster():
+    """리사이즈된 포스터 로드 함수 (원본이 없으면 None)"""
+    return assets.load_variant(assets.find_poster(), assets.POSTER_WIDTH)
+
+@st.cache_data
+def load_characters():
+    """캐릭터 목록 로드 함수"""
+    return assets.load_characters()
 
 # 사이드바 구성
 # 사이드바 설정
@@ -82,30 +154,34 @@ st.sidebar.divider()  # 구분선
 st.sidebar.info('**C221088 최유빈**')
 
 st.sidebar.write('### 📊 분석 옵션')
+# 위젯 key: 부하 테스트(loadtest.py)에서 세션별 위젯 값 지정에 사용
 
 # 위젯 1: 체크박스
 show_raw_data = st.sidebar.checkbox('원본 데이터 보기')
 
 # 위젯 2: 슬라이더
-top_n_words = st.sidebar.slider('워드클라우드 단어 수', 10, 100, 50)
+top_n_words = st.sidebar.slider('워드클라우드 단어 수', 10, 100, 50, key='top_n_words')
 
 # 위젯 3: 셀렉트박스
 network_min_weight = st.sidebar.selectbox(
     '네트워크 최소 연결 강도',
-    [3, 5, 10, 15, 20]
+    [3, 5, 10, 15, 20],
+    key='network_min_weight'
 )
 
 # 위젯 4: 라디오 버튼
 chart_theme = st.sidebar.radio(
     '차트 색상 테마',
-    ['기본', '다크', '컬러풀']
+    ['기본', '다크', '컬러풀'],
+    key='chart_theme'
 )
 
 # 위젯 5: 멀티셀렉트
 analysis_options = st.sidebar.multiselect(
     '분석 항목 선택',
     ['시계열 분석', '키워드 추이 분석', '키워드 빈도 분석', '워드클라우드', '네트워크 분석'],
-    default=['시계열 분석', '키워드 추이 분석', '키워드 빈도 분석', '워드클라우드', '네트워크 분석']
+    default=['시계열 분석', '키워드 추이 분석', '키워드 빈도 분석', '워드클라우드', '네트워크 분석'],
+    key='analysis_options'
 )
 
 st.sidebar.divider()  # 구분선
@@ -125,11 +201,10 @@ st.header('📺 작품 기본 정보')
 col1, col2 = st.columns([1, 2])
 
 with col1:
-    # 이미지 출력
-    if os.path.exists('data/poster.jpg'):
-        st.image('data/poster.jpg', caption='K팝 데몬 헌터스 포스터', use_container_width=True)
-    elif os.path.exists('data/poster.png'):
-        st.image('data/poster.png', caption='K팝 데몬 헌터스 포스터', use_container_width=True)
+    # 이미지 출력 (컬럼 폭에 맞춘 변환 이미지)
+    poster = load_poster()
+    if poster is not None:
+        st.image(poster, caption='K팝 데몬 헌터스 포스터', use_container_width=True)
     else:
         st.image('https://via.placeholder.com/300x400?text=Poster', 
                  caption='K팝 데몬 헌터스', use_container_width=True)
@@ -159,18 +234,15 @@ st.header('🎭 주요인물')
 # 컬럼 레이아웃
 char_cols = st.columns(5)
 
-# 캐릭터 정보 리스트
-characters = [
-    {'name': '루미', 'role': '리더', 'image': 'data/rumi.png'},
-    {'name': '미라', 'role': '래퍼', 'image': 'data/mira.png'},
-    {'name': '조이', 'role': '래퍼', 'image': 'data/joy.png'}
-]
+# 캐릭터 정보 리스트 (data/characters.json)
+characters = load_characters()
 
 for i, char in enumerate(characters):
     with char_cols[i]:
-        # 이미지 출력
-        if os.path.exists(char['image']):
-            st.image(char['image'], use_container_width=True)
+        # 이미지 출력 (컬럼 폭에 맞춘 변환 이미지)
+        image = load_image(char['image'], assets.CHARACTER_WIDTH)
+        if image is not None:
+            st.image(image, use_container_width=True)
         else:
             st.image(f'https://via.placeholder.com/150x200?text={char["name"]}', 
                     use_container_width=True)
@@ -209,35 +281,15 @@ except FileNotFoundError:
     
     # 샘플 데이터 생성 (테스트용)
     st.info('테스트용 샘플 데이터를 생성합니다.')
-    
-    np.random.seed(42)
-    dates = pd.date_range(start='2025-06-15', end='2025-09-20', freq='D')
-    
-    # 샘플 데이터
-    sample_data = []
-    keywords = ['노래', '케이팝', '한국', '넷플릭스', '인기', '응원', '최고', '문화', '주말', '아이돌', '케데헌', '케데헌 효과']
-    
-    for date in dates:
-        n_articles = np.random.randint(50, 300)
-        for _ in range(n_articles // 10):
-            title = f"케이팝 데몬 헌터스 {np.random.choice(keywords)} 화제"
-            desc = f"{np.random.choice(keywords)} {np.random.choice(keywords)} 케이팝 데몬 헌터스 {np.random.choice(keywords)}"
-            sample_data.append({
-                'pubDate': date,
-                'title': title,
-                'description': desc,
-                'date': date
-            })
-    
-    df = pd.DataFrame(sample_data)
-    df['pubDate'] = pd.to_datetime(df['pubDate'])
-    df['date'] = pd.to_datetime(df['date'])
+    df = load_sample_data()
     data_loaded = True
 
 # 원본 데이터 표시
 if data_loaded and show_raw_data:
     st.subheader('📋 원본 데이터')
     st.dataframe(df.head(20))
+    # 메모리 사용량 (공유 데이터프레임 기준)
+    st.caption(f"메모리 사용량: {df.memory_usage(deep=True).sum() / 1024:,.1f} KB")
 
 # 지표 표시
 if data_loaded:
@@ -260,11 +312,10 @@ if data_loaded and '시계열 분석' in analysis_options:
     st.write('> 시간에 따른 뉴스 기사 수 변화를 통해 **관심도 추이**와 **주요 이벤트**를 파악')
     
     # 일별 기사 수 집계
-    daily_counts = df.groupby('date').size().reset_index(name='count')
-    
-    # 주차 정보 추가
-    daily_counts['week'] = daily_counts['date'].dt.isocalendar().week
-    daily_counts['month'] = daily_counts['date'].dt.month
+    # 월 정보는 load_data에서 계산한 month 범주 사용
+    daily_counts = df.groupby(['date', 'month'], observed=True).size().reset_index(name='count')
+    daily_counts['date'] = daily_counts['date'].astype('datetime64[ns]')
+    daily_counts['month'] = daily_counts['month'].astype(int)
     
     # Plotly 그래프
     fig = go.Figure()
@@ -332,21 +383,16 @@ if data_loaded and '키워드 추이 분석' in analysis_options:
     # 형태소 분석기
     okt = Okt()
     
-    # 주차별 키워드 빈도 계산
-    df['week_label'] = df['date'].dt.strftime('%m월 ') + ((df['date'].dt.day - 1) // 7 + 1).astype(str) + '주차'
-    
     # 타겟 키워드
     target_keywords = ['노래', '케이팝', '한국', '주말', '넷플릭스', '문화', '인기', '응원', '최고', '케데헌 효과']
     
     # 주차별 키워드 빈도 집계
     keyword_data = []
     
-    for week_label in df['week_label'].unique():
-        week_df = df[df['week_label'] == week_label]
-        all_text = ' '.join(week_df['title'].tolist() + week_df['description'].tolist())
-        
-        # 텍스트 정제
-        cleaned_text = cleanString(all_text)
+    # 주차 라벨(load_data에서 계산)별로 그룹화
+    for week_label, week_df in df.groupby('week_label', observed=True):
+        # 정제된 텍스트 결합 (load_data에서 정제)
+        cleaned_text = ' '.join(week_df['title_clean'].tolist() + week_df['description_clean'].tolist())
         
         # 형태소 분리
         words = okt.morphs(cleaned_text)
@@ -399,11 +445,8 @@ if data_loaded and '키워드 빈도 분석' in analysis_options:
     # 형태소 분석기 (강의록 13.ipynb)
     okt = Okt()
     
-    # 전체 텍스트 결합
-    all_text = ' '.join(df['title'].tolist() + df['description'].tolist())
-    
-    # 텍스트 정제 (강의록 13.ipynb)
-    cleaned_text = cleanString(all_text)
+    # 정제된 전체 텍스트 결합 (load_data에서 정제, 강의록 13.ipynb)
+    cleaned_text = ' '.join(df['title_clean'].tolist() + df['description_clean'].tolist())
     
     # 명사 추출 (강의록 13.ipynb)
     nouns = okt.nouns(cleaned_text)
@@ -456,11 +499,8 @@ if data_loaded and '워드클라우드' in analysis_options:
     # 형태소 분석기
     okt = Okt()
     
-    # 전체 텍스트 결합
-    all_text = ' '.join(df['title'].tolist() + df['description'].tolist())
-    
-    # 텍스트 정제
-    cleaned_text = cleanString(all_text)
+    # 정제된 전체 텍스트 결합 (load_data에서 정제)
+    cleaned_text = ' '.join(df['title_clean'].tolist() + df['description_clean'].tolist())
     
     # 명사 추출
     nouns = okt.nouns(cleaned_text)
@@ -524,11 +564,10 @@ if data_loaded and '네트워크 분석' in analysis_options:
     
     # 각 기사별 명사 추출
     all_nouns = []
-    descriptions = df['description'].tolist()
+    # 정제된 기사 본문 (load_data에서 정제)
+    descriptions = df['description_clean'].tolist()
     
-    for text in descriptions:
-        # 정제
-        text_cleaned = re.sub(r'[^가-힣\s]', '', str(text))
+    for text_cleaned in descriptions:
         # 명사 추출
         nouns = okt.nouns(text_cleaned)
         # 불용어 제거
@@ -0,0 +1,114 @@
+# 이미지 에셋 파이프라인
+# 화면에 표시되는 컬럼 폭에 맞춰 리사이즈/압축한 이미지를 미리 생성
+# 사용법: python assets.py  (data/resized/ 에 변환 이미지 생성)
+#
+# st.image는 JPEG/PNG/GIF만 그대로 전송하고 그 외 형식은 매 실행마다 다시 인코딩함
+# (투명도가 있으면 PNG, 없으면 JPEG). 같은 기준으로 인코딩해 두면 변환 없이 전송됨
+import io
+import json
+import os
+
+from PIL import Image
+
+# 경로 설정
+POSTER_PATHS = ['data/poster.jpg', 'data/poster.png']
+MANIFEST_PATH = 'data/characters.json'
+RESIZED_DIR = 'data/resized'
+
+# 표시 폭 (px) - wide 레이아웃 기준
+POSTER_WIDTH = 480      # st.columns([1, 2])의 첫 번째 컬럼
+CHARACTER_WIDTH = 280   # st.columns(5)의 한 컬럼
+
+# 인코딩 설정
+FORMATS = {
+    'JPEG': {'ext': 'jpg', 'options': {'quality': 85, 'optimize': True, 'progressive': True}},
+    'PNG': {'ext': 'png', 'options': {'optimize': True}},
+}
+
+
+def find_poster():
+    """존재하는 포스터 원본 경로 반환 (없으면 None)"""
+    for path in POSTER_PATHS:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def load_characters(path=MANIFEST_PATH):
+    """캐릭터 매니페스트(JSON) 로드"""
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def has_transparency(img):
+    """실제로 투명한 픽셀이 있는지 확인"""
+    if img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info):
+        return img.convert('RGBA').getextrema()[3][0] < 255
+    return False
+
+
+def output_format(path):
+    """원본에 맞는 전송 형식 (투명도가 있으면 PNG, 없으면 JPEG)"""
+    with Image.open(path) as img:
+        return 'PNG' if has_transparency(img) else 'JPEG'
+
+
+def variant_path(path, width, fmt):
+    """변환 이미지 저장 경로 (예: data/resized/rumi_280.jpg)"""
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(RESIZED_DIR, f"{name}_{width}.{FORMATS[fmt]['ext']}")
+
+
+def resize_image(path, width, fmt):
+    """원본 이미지를 표시 폭에 맞게 줄이고 인코딩한 바이트 반환"""
+    with Image.open(path) as img:
+        img = img.convert('RGBA' if fmt == 'PNG' else 'RGB')
+        # 표시 폭보다 작은 이미지는 확대하지 않음
+        if img.width > width:
+            height = round(img.height * width / img.width)
+            img = img.resize((width, height), Image.LANCZOS)
+        buffer = io.BytesIO()
+        img.save(buffer, format=fmt, **FORMATS[fmt]['options'])
+    return buffer.getvalue()
+
+
+def load_variant(path, width):
+    """변환 이미지 바이트 로드 (없거나 원본보다 오래되었으면 새로 생성)
+
+    원본이 없으면 None 반환
+    """
+    if path is None or not os.path.exists(path):
+        return None
+
+    fmt = output_format(path)
+    out_path = variant_path(path, width, fmt)
+    if os.path.exists(out_path) and os.path.getmtime(out_path) >= os.path.getmtime(path):
+        with open(out_path, 'rb') as f:
+            return f.read()
+
+    data = resize_image(path, width, fmt)
+    # 저장 실패(읽기 전용 환경 등)해도 메모리의 바이트는 그대로 사용
+    try:
+        os.makedirs(RESIZED_DIR, exist_ok=True)
+        with open(out_path, 'wb') as f:
+            f.write(data)
+    except OSError:
+        pass
+    return data
+
+
+def build_all():
+    """포스터와 캐릭터 이미지의 변환본을 모두 생성"""
+    targets = [(find_poster(), POSTER_WIDTH)]
+    targets += [(char['image'], CHARACTER_WIDTH) for char in load_characters()]
+
+    for path, width in targets:
+        if path is None or not os.path.exists(path):
+            continue
+        data = load_variant(path, width)
+        print(f"{path} ({os.path.getsize(path) / 1024:,.0f} KB) "
+              f"-> {variant_path(path, width, output_format(path))} ({len(data) / 1024:,.0f} KB)")
+
+
+if __name__ == '__main__':
+    build_all()
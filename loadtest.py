@@ -0,0 +1,314 @@
+# 대시보드 부하 테스트
+# 실제 streamlit 서버를 띄우고 여러 헤드리스 세션(웹소켓 클라이언트)을 동시에 접속시켜
+# 사이드바 위젯을 바꿔가며 rerun 지연 시간, 세션당 메모리, 처리량을 측정
+#
+# 사용법:
+#   python loadtest.py                                  # 기본: 500/2000/10000건, 동시 8세션
+#   python loadtest.py --sizes 1000 5000 --sessions 16 --reruns 20
+#   python loadtest.py --options '시계열 분석' '키워드 빈도 분석' --json result.json
+#
+# 참고:
+# - 브라우저와 같은 방식(BackMsg/ForwardMsg)으로 통신하므로 requirements.txt의
+#   streamlit 버전(1.52)의 위젯 값 형식을 따름 (widget_state 함수)
+# - 각 세션의 첫 실행은 새 브라우저 탭처럼 기본 위젯 값으로 실행됨
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+import numpy as np
+import pandas as pd
+import psutil
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from tornado.httpclient import HTTPRequest
+from tornado.websocket import websocket_connect
+
+# 경로 설정
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(BASE_DIR, 'app.py')
+
+# 사이드바 위젯 값 (app.py의 위젯 key, 선택지와 동일)
+ANALYSIS_OPTIONS = ['시계열 분석', '키워드 추이 분석', '키워드 빈도 분석', '워드클라우드', '네트워크 분석']
+NETWORK_MIN_WEIGHTS = [3, 5, 10, 15, 20]
+CHART_THEMES = ['기본', '다크', '컬러풀']
+WIDGET_KEYS = ['top_n_words', 'network_min_weight', 'chart_theme', 'analysis_options']
+
+# 샘플 기사 생성용 단어
+KEYWORDS = ['노래', '케이팝', '한국', '넷플릭스', '인기', '응원', '최고', '문화', '주말', '아이돌',
+            '케데헌', '케데헌 효과', '빌보드', '차트', '애니메이션', 'OST', '팬덤', '흥행', '세계', '기록']
+
+
+def make_corpus(n_articles, seed=42):
+    """네이버 뉴스 CSV와 같은 형식의 샘플 기사 데이터 생성"""
+    rng = np.random.default_rng(seed)
+    days = pd.date_range(start='2025-06-20', end='2025-09-20', freq='D')
+
+    pub_dates = days[rng.integers(0, len(days), n_articles)] + pd.to_timedelta(rng.integers(0, 86400, n_articles), unit='s')
+    words = rng.choice(KEYWORDS, size=(n_articles, 12))
+
+    # 수집 데이터처럼 일부 HTML 엔티티 포함
+    titles = [f"케이팝 데몬 헌터스 &quot;{w[0]}&quot; {w[1]} 화제" for w in words]
+    descriptions = [f"{' '.join(w[2:7])} 케이팝 데몬 헌터스 {' '.join(w[7:])}&amp; 더보기" for w in words]
+
+    df = pd.DataFrame({'pubDate': pub_dates, 'title': titles, 'description': descriptions})
+    df['date'] = df['pubDate'].dt.date
+    return df.sort_values('pubDate', ascending=False, ignore_index=True)
+
+
+def prepare_workdir(n_articles, seed):
+    """앱이 사용하는 상대 경로(data/, font/)를 갖춘 임시 작업 디렉터리 생성"""
+    workdir = tempfile.mkdtemp(prefix=f'loadtest_{n_articles}_')
+    os.makedirs(os.path.join(workdir, 'data'))
+
+    # 폰트와 이미지는 원본을 링크, 기사 데이터만 생성한 파일 사용
+    os.symlink(os.path.join(BASE_DIR, 'font'), os.path.join(workdir, 'font'))
+    for name in os.listdir(os.path.join(BASE_DIR, 'data')):
+        if name != 'naver_news.csv':
+            os.symlink(os.path.join(BASE_DIR, 'data', name), os.path.join(workdir, 'data', name))
+
+    make_corpus(n_articles, seed).to_csv(os.path.join(workdir, 'data', 'naver_news.csv'), index=False, encoding='utf-8')
+    return workdir
+
+
+def start_server(workdir, timeout=60):
+    """작업 디렉터리에서 streamlit 서버 실행 후 (프로세스, 포트) 반환"""
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        port = s.getsockname()[1]
+
+    proc = subprocess.Popen(
+        [sys.executable, '-m', 'streamlit', 'run', APP_PATH,
+         '--server.headless', 'true',
+         '--server.port', str(port),
+         '--server.address', '127.0.0.1',
+         '--server.fileWatcherType', 'none',
+         '--browser.gatherUsageStats', 'false'],
+        cwd=workdir,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    # 헬스 체크가 응답할 때까지 대기
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError('streamlit 서버가 시작 중 종료되었습니다.')
+        try:
+            with urllib.request.urlopen(f'http://127.0.0.1:{port}/_stcore/health', timeout=1) as res:
+                if res.status == 200:
+                    return proc, port
+        except OSError:
+            time.sleep(0.2)
+
+    proc.kill()
+    raise RuntimeError('streamlit 서버가 제한 시간 안에 시작되지 않았습니다.')
+
+
+def random_widgets(rng, options):
+    """실제 사용자처럼 사이드바 위젯 값을 무작위로 선택"""
+    return {
+        'analysis_options': rng.sample(options, rng.randint(1, len(options))),
+        'top_n_words': rng.randint(10, 100),
+        'network_min_weight': rng.choice(NETWORK_MIN_WEIGHTS),
+        'chart_theme': rng.choice(CHART_THEMES),
+    }
+
+
+def widget_state(state, key, value):
+    """위젯 값을 브라우저가 보내는 WidgetState 형식으로 기록 (streamlit 1.52 기준)"""
+    if key == 'top_n_words':            # slider
+        state.double_array_value.data[:] = [value]
+    elif key == 'network_min_weight':   # selectbox: 표시 문자열
+        state.string_value = str(value)
+    elif key == 'chart_theme':          # radio: 선택지 인덱스
+        state.int_value = CHART_THEMES.index(value)
+    elif key == 'analysis_options':     # multiselect: 표시 문자열 목록
+        state.string_array_value.data[:] = value
+
+
+def rerun_message(widget_ids, widgets):
+    """위젯 값을 담은 rerun 요청 메시지 생성"""
+    msg = BackMsg()
+    msg.rerun_script.query_string = ''
+    msg.rerun_script.page_script_hash = ''
+    if widgets:
+        for key, value in widgets.items():
+            state = msg.rerun_script.widget_states.widgets.add()
+            state.id = widget_ids[key]
+            widget_state(state, key, value)
+    return msg.SerializeToString()
+
+
+async def wait_script_finished(ws, widget_ids):
+    """스크립트 실행이 끝날 때까지 메시지를 읽고, 위젯 id와 예외 메시지 수집"""
+    errors = []
+    while True:
+        payload = await ws.read_message()
+        if payload is None:
+            raise ConnectionError('웹소켓 연결이 끊어졌습니다.')
+
+        msg = ForwardMsg()
+        msg.ParseFromString(payload)
+        kind = msg.WhichOneof('type')
+
+        if kind == 'delta' and msg.delta.WhichOneof('type') == 'new_element':
+            element = msg.delta.new_element
+            element_type = element.WhichOneof('type')
+            if element_type == 'exception':
+                errors.append(element.exception.message)
+            elif element_type in ('slider', 'selectbox', 'radio', 'multiselect'):
+                # key를 지정한 위젯의 id는 '-{key}'로 끝남
+                element_id = getattr(element, element_type).id
+                for key in WIDGET_KEYS:
+                    if element_id.endswith('-' + key):
+                        widget_ids[key] = element_id
+        elif kind == 'script_finished':
+            return errors
+
+
+async def run_session(port, session_id, reruns, options, timeout, seed):
+    """한 세션 실행: 접속 후 위젯을 바꿔가며 rerun, 각 실행 시간 기록"""
+    rng = random.Random(seed + session_id)
+    request = HTTPRequest(f'ws://127.0.0.1:{port}/_stcore/stream', headers={'Origin': f'http://127.0.0.1:{port}'})
+    ws = await websocket_connect(request, subprotocols=['streamlit'], max_message_size=2**30)
+
+    widget_ids = {}
+    latencies = []
+    errors = []
+    for i in range(reruns + 1):
+        # 첫 실행은 기본 위젯 값 (새 브라우저 탭과 동일)
+        widgets = random_widgets(rng, options) if i > 0 else None
+        if widgets and len(widget_ids) < len(WIDGET_KEYS):
+            errors.append('사이드바 위젯을 찾을 수 없습니다.')
+            break
+
+        start = time.perf_counter()
+        ws.write_message(rerun_message(widget_ids, widgets), binary=True)
+        try:
+            errors += await asyncio.wait_for(wait_script_finished(ws, widget_ids), timeout)
+        except (asyncio.TimeoutError, ConnectionError) as e:
+            errors.append(f'{type(e).__name__}: {e}')
+            break
+        latencies.append(time.perf_counter() - start)
+
+    # 첫 실행(페이지 로드)은 rerun 지연 시간에서 제외
+    # 연결은 메모리 측정 후 닫도록 함께 반환
+    return {'first_run': latencies[0] if latencies else None, 'latencies': latencies[1:], 'errors': errors, 'ws': ws}
+
+
+async def run_load_test(port, server, n_articles, sessions, reruns, options, timeout, seed):
+    """코퍼스 크기 하나에 대해 동시 세션 부하 테스트 실행"""
+    # 워밍업 세션: 모듈 import와 공유 캐시(load_data 등) 생성 비용을 측정에서 제외
+    warmup = await run_session(port, -1, 0, options, timeout, seed)
+    warmup['ws'].close()
+
+    rss_before = server.memory_info().rss
+    rss_peak = rss_before
+
+    async def sample_memory():
+        nonlocal rss_peak
+        while True:
+            rss_peak = max(rss_peak, server.memory_info().rss)
+            await asyncio.sleep(0.1)
+
+    sampler = asyncio.create_task(sample_memory())
+    start = time.perf_counter()
+    results = await asyncio.gather(*[run_session(port, i, reruns, options, timeout, seed) for i in range(sessions)])
+    elapsed = time.perf_counter() - start
+    # 세션이 모두 접속해 있는 상태의 메모리
+    rss_after = server.memory_info().rss
+    sampler.cancel()
+    for r in results:
+        r['ws'].close()
+
+    latencies = np.array([t for r in results for t in r['latencies']])
+    first_runs = [r['first_run'] for r in results if r['first_run'] is not None]
+    errors = warmup['errors'] + [e for r in results for e in r['errors']]
+    total_runs = len(latencies) + len(first_runs)
+
+    def pct(q):
+        return float(np.percentile(latencies, q)) if len(latencies) else None
+
+    return {
+        'articles': n_articles,
+        'sessions': sessions,
+        'reruns': int(len(latencies)),
+        'errors': len(errors),
+        'error_samples': sorted(set(errors))[:3],
+        'first_run_max_s': max(first_runs) if first_runs else None,
+        'p50_s': pct(50),
+        'p95_s': pct(95),
+        'p99_s': pct(99),
+        'throughput_rps': total_runs / elapsed if elapsed else None,
+        'mem_per_session_mb': (rss_after - rss_before) / sessions / 2**20,
+        'mem_peak_mb': rss_peak / 2**20,
+    }
+
+
+def print_report(reports):
+    """결과 표 출력"""
+    def fmt(value, spec):
+        return '-' if value is None else format(value, spec)
+
+    header = f"{'articles':>9} {'sess':>5} {'reruns':>7} {'err':>4} {'p50(s)':>8} {'p95(s)':>8} {'p99(s)':>8} {'rps':>7} {'MB/sess':>8} {'peakMB':>8}"
+    print(header)
+    print('-' * len(header))
+    for r in reports:
+        print(f"{r['articles']:>9,} {r['sessions']:>5} {r['reruns']:>7} {r['errors']:>4} "
+              f"{fmt(r['p50_s'], '8.3f')} {fmt(r['p95_s'], '8.3f')} {fmt(r['p99_s'], '8.3f')} "
+              f"{fmt(r['throughput_rps'], '7.2f')} {fmt(r['mem_per_session_mb'], '8.1f')} {fmt(r['mem_peak_mb'], '8.1f')}")
+        for message in r['error_samples']:
+            print(f"{'':>9} ! {message}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='K팝 데몬 헌터스 대시보드 부하 테스트')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[500, 2000, 10000], help='코퍼스 크기(기사 수) 목록')
+    parser.add_argument('--sessions', type=int, default=8, help='동시 세션 수')
+    parser.add_argument('--reruns', type=int, default=10, help='세션당 위젯 변경 rerun 횟수')
+    parser.add_argument('--options', nargs='+', default=ANALYSIS_OPTIONS, choices=ANALYSIS_OPTIONS,
+                        help='무작위로 선택할 분석 항목')
+    parser.add_argument('--timeout', type=float, default=300, help='rerun 한 번의 제한 시간(초)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', help='결과를 저장할 JSON 파일 경로')
+    args = parser.parse_args()
+
+    reports = []
+    for n_articles in args.sizes:
+        print(f'[{n_articles:,}건] 동시 {args.sessions}세션 x {args.reruns}회 rerun ...', flush=True)
+
+        # 코퍼스마다 새 서버 (캐시와 메모리 기준점 초기화)
+        workdir = prepare_workdir(n_articles, args.seed)
+        try:
+            proc, port = start_server(workdir)
+            try:
+                reports.append(asyncio.run(run_load_test(
+                    port, psutil.Process(proc.pid), n_articles,
+                    args.sessions, args.reruns, args.options, args.timeout, args.seed
+                )))
+            finally:
+                proc.terminate()
+                proc.wait()
+        finally:
+            # 생성한 코퍼스와 링크 삭제 (링크 대상인 원본 파일은 유지)
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    print()
+    print_report(reports)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(reports, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+# 텍스트 정제 모듈
+# 수집(api.py)과 대시보드(app.py)가 같은 정제 규칙을 사용하도록 한 곳에서 정의
+import html
+import re
+
+import pandas as pd
+
+# HTML 태그와 HTML 엔티티(&quot; &amp; &#39; ...)
+_markup = r'<[^>]*>|&(?:#\d+|#[xX][0-9a-fA-F]+|[A-Za-z]\w*);'
+
+# 미리 컴파일한 패턴
+markup_pattern = re.compile(_markup)
+# 태그, 엔티티, 특수문자를 한 번에 매칭
+clean_pattern = re.compile(_markup + r'|[^\w\s]')
+# 엔티티 변환 결과가 글자/공백인지 확인
+keep_pattern = re.compile(r'[\w\s]*')
+# 특수문자
+special_pattern = re.compile(r'[^\w\s]')
+
+
+def _markup_repl(match):
+    """태그는 제거하고 엔티티는 원래 문자로 변환"""
+    token = match.group()
+    if token[0] == '<':
+        return ''
+    return html.unescape(token)
+
+
+def _clean_repl(match):
+    """태그와 특수문자는 제거하고 엔티티는 글자/공백일 때만 남김"""
+    token = match.group()
+    if token[0] == '&' and len(token) > 1:
+        char = html.unescape(token)
+        # 엔티티가 아닌 '&단어;' (예: R&B;)는 특수문자만 제거하고 글자는 유지
+        if char == token:
+            return special_pattern.sub('', token)
+        return char if keep_pattern.fullmatch(char) else ''
+    return ''
+
+
+def strip_markup(text):
+    """HTML 태그 제거 및 엔티티 변환 (수집 단계)"""
+    return markup_pattern.sub(_markup_repl, str(text))
+
+
+def clean_text(text):
+    """HTML 태그, 엔티티, 특수문자를 한 번에 정제 (분석 단계)
+
+    >>> clean_text('<b>케이팝</b> &quot;데몬&quot; 헌터스!')
+    '케이팝 데몬 헌터스'
+    >>> clean_text('R&B; 차트 AT&T;')
+    'RB 차트 ATT'
+    """
+    return clean_pattern.sub(_clean_repl, str(text))
+
+
+def clean_series(series):
+    """Series의 각 값을 정제 (결측값은 빈 문자열)"""
+    cleaned = [clean_text(text) for text in series.fillna('').tolist()]
+    return pd.Series(cleaned, index=series.index, dtype=series.dtype, name=series.name)